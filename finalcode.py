@@ -1,9 +1,8 @@
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
 import pydeck as pdk
-import matplotlib.pyplot as plt
-import seaborn as sns
 def comment_doc_string():
     """
     Name: Ava Radford
@@ -17,36 +16,74 @@ def comment_doc_string():
     It features interactive widgets, detailed charts, and a map visualization.
     """
     pass #preventing docstring from being displayed when running
-# [ST4] Page configuration 
+# [ST4] Page configuration
 st.set_page_config(page_title="Airbnb Data Analysis", layout="wide")
 
-
-# [DA1] Clean the data with lambda function, and [PY2] Function returning multiple values 
+# Only the columns the app actually uses, with explicit dtypes so the CSV
+# parser can skip the rest and avoid type inference
+LISTING_COLS = ['id', 'name', 'neighbourhood', 'latitude', 'longitude', 'price',
+                'minimum_nights', 'number_of_reviews', 'reviews_per_month', 'availability_365']
+LISTING_DTYPES = {
+    'name': 'string',
+    'neighbourhood': 'category',
+    'latitude': 'float32',
+    'longitude': 'float32',
+    'minimum_nights': 'int32',
+    'number_of_reviews': 'int32',
+    'reviews_per_month': 'float32',
+    'availability_365': 'int16'
+}
+
+
+# [DA1] Clean the data with lambda function, and [PY2] Function returning multiple values
 @st.cache_data
-def load_data(listings_path, reviews_path, neighborhoods_path):
+def load_data(listings_path, neighborhoods_path):
     try:
-        # Load datasets
-        listings = pd.read_csv(listings_path)
-        reviews = pd.read_csv(reviews_path)
-        neighborhoods = pd.read_csv(neighborhoods_path)
-
-        # Clean data (remove $, and fills missing reviews with 0)
-        listings['price'] = listings['price'].replace(r'\$|,', '', regex=True).astype(float)
-        listings['reviews_per_month'] = listings['reviews_per_month'].fillna(0)
-
-        # Create new column for price per night 
-        listings['price_per_night'] = listings['price'] / listings['minimum_nights']
-
-        return listings, reviews, neighborhoods
+        # Load listings from the Parquet cache when it exists (much faster than re-parsing the CSV)
+        listings_cache = listings_path + '.parquet'
+        if os.path.exists(listings_cache):
+            listings = pd.read_parquet(listings_cache, engine='pyarrow')
+        else:
+            # Stick with the default C engine: pyarrow infers the price column
+            # (which has empty cells) as integer-with-nulls and pandas 3 fails
+            # casting it, and the Parquet cache covers repeat cold starts anyway
+            listings = pd.read_csv(listings_path, usecols=LISTING_COLS, dtype=LISTING_DTYPES)
+
+            # Clean data (remove $, and fills missing reviews with 0)
+            # Literal replaces are faster than a regex pass, and downcast gives float32
+            price_text = listings['price'].astype(str).str.replace('$', '', regex=False).str.replace(',', '', regex=False)
+            listings['price'] = pd.to_numeric(price_text, downcast='float')
+            listings['reviews_per_month'] = listings['reviews_per_month'].fillna(0)
+
+            # Create new column for price per night
+            # One vectorized divide on float32 arrays; the where= guard leaves 0
+            # instead of inf when minimum_nights is 0
+            prices = listings['price'].to_numpy(np.float32)
+            nights = listings['minimum_nights'].to_numpy(np.float32)
+            price_per_night = np.zeros_like(prices)
+            np.divide(prices, nights, out=price_per_night, where=nights > 0)
+            listings['price_per_night'] = price_per_night
+
+            # Save the cleaned data so the next cold start skips the CSV parse
+            listings.to_parquet(listings_cache, engine='pyarrow', compression='zstd')
+
+        # Same Parquet cache idea for the neighborhoods dataset
+        neighborhoods_cache = neighborhoods_path + '.parquet'
+        if os.path.exists(neighborhoods_cache):
+            neighborhoods = pd.read_parquet(neighborhoods_cache, engine='pyarrow')
+        else:
+            neighborhoods = pd.read_csv(neighborhoods_path, usecols=['neighbourhood'], dtype={'neighbourhood': 'string'})
+            neighborhoods.to_parquet(neighborhoods_cache, engine='pyarrow', compression='zstd')
+
+        return listings, neighborhoods
     except Exception as e: # [PY3] Error handling with try/except
         st.error(f"Error loading data: {e}")
-        return None, None, None
+        return None, None
 
 
-# Load data
-listings, reviews, neighborhoods = load_data(
+# Load data (reviews.csv is not used by any section, so it is never read)
+listings, neighborhoods = load_data(
     'listings.csv',
-    'reviews.csv',
     'neighbourhoods.csv'
 )
 
@@ -55,10 +92,100 @@ section = st.sidebar.radio("Choose a Section",
                            ("Boston Airbnb Overview", "Statistics By Neighborhood", "Listing Map and Price Distribution By Neighborhood"))
 
 
+# The cached helpers below take no arguments and close over the module-level
+# listings frame, so their cache key is constant — Streamlit never has to
+# hash the DataFrame itself on a rerun.
+
+# Cached so the groupby only runs once per session instead of on every rerun
+@st.cache_data
+def compute_neighborhood_summary():
+    # Named aggregation dispatches each reduction to its cython kernel in one
+    # pass, and 'size' skips the per-cell NaN check that 'count' does
+    return listings.groupby('neighbourhood', sort=False, observed=True).agg(**{
+        'Average Price': ('price', 'mean'),
+        'Total Reviews': ('number_of_reviews', 'sum'),
+        'Available Listings Count': ('availability_365', 'size')
+    }).reset_index()
+
+
+# Cached widget inputs so the sidebar doesn't rescan full columns on every rerun
+@st.cache_data
+def price_bounds():
+    # nanmin/nanmax skip the listings with no price, like Series.min/max did
+    prices = listings['price'].to_numpy()
+    return int(np.nanmin(prices)), int(np.nanmax(prices))
+
+
+@st.cache_data
+def neighborhood_options():
+    return listings['neighbourhood'].unique()
+
+
+# Cached row positions per neighborhood, so filtering is a dict lookup instead of a full scan
+@st.cache_data
+def _nbhd_index():
+    return {k: v for k, v in listings.groupby('neighbourhood', observed=True).indices.items()}
+
+
 # [PY1] Function to filter listings by neighborhood and price
+# Cached on the filter values, so reruns and the map share one result per selection
+@st.cache_data
 def filter_listings(neighborhood, price_range=(50, 300)):
-    return listings[(listings['neighbourhood'] == neighborhood) &
-                    (listings['price'].between(price_range[0], price_range[1]))]
+    sub = listings.iloc[_nbhd_index()[neighborhood]]
+    return sub[sub['price'].between(price_range[0], price_range[1])]
+
+
+# Viridis color ramp anchors (RGB), interpolated with numpy so map points can
+# be colored by price like the old seaborn charts, without needing matplotlib
+VIRIDIS_ANCHORS = np.array([[68, 1, 84], [59, 82, 139], [33, 145, 140],
+                            [94, 201, 98], [253, 231, 37]], dtype=np.float32)
+
+
+def price_colors(prices, price_low, price_high):
+    t = np.clip((prices - price_low) / max(price_high - price_low, 1), 0.0, 1.0)
+    stops = np.linspace(0.0, 1.0, len(VIRIDIS_ANCHORS))
+    red = np.interp(t, stops, VIRIDIS_ANCHORS[:, 0]).astype(np.uint8)
+    green = np.interp(t, stops, VIRIDIS_ANCHORS[:, 1]).astype(np.uint8)
+    blue = np.interp(t, stops, VIRIDIS_ANCHORS[:, 2]).astype(np.uint8)
+    return red, green, blue
+
+
+# Cached so re-selecting a previous filter reuses the already-built Deck
+# instead of re-serializing the listing coordinates to JSON
+@st.cache_resource
+def build_deck(neighborhood, price_low, price_high):
+    sub = filter_listings(neighborhood, (price_low, price_high))
+    # The layer data goes to the browser as JSON. Rounding float32 is useless
+    # there (the values still serialize with full-length reprs), so cast to
+    # float64 first — then 42.35173 really is 8 characters in the payload
+    map_data = sub[['longitude', 'latitude', 'name', 'price_per_night']].copy()
+    map_data[['longitude', 'latitude']] = map_data[['longitude', 'latitude']].astype('float64').round(5)
+    map_data['price_per_night'] = map_data['price_per_night'].astype('float64').round(2)
+    # Precomputed uint8 color columns, so deck.gl reads them directly instead
+    # of evaluating a color expression for every point
+    red, green, blue = price_colors(sub['price'].to_numpy(np.float32), price_low, price_high)
+    map_data = map_data.assign(r=red, g=green, b=blue)
+    map_layer = pdk.Layer(
+        'ScatterplotLayer',
+        data=map_data,
+        get_position='[longitude, latitude]',
+        get_radius=150,
+        get_color='[r, g, b, 160]',
+        pickable=True
+    )
+    # One fused reduction over both coordinate columns for the map center
+    centroid = sub[['latitude', 'longitude']].to_numpy().mean(axis=0)
+    view_state = pdk.ViewState(
+        latitude=float(centroid[0]),
+        longitude=float(centroid[1]),
+        zoom=13,
+        pitch=45
+    )
+    return pdk.Deck(
+        layers=[map_layer],
+        initial_view_state=view_state,
+        tooltip={"text": "{name}: ${price_per_night}"}
+    )
 
 
 # [ST1] Display different content based on the selected section
@@ -81,64 +208,27 @@ elif section == "Statistics By Neighborhood":
     st.subheader("Neighborhood Summary")
 
     # [DA6] Group and aggregate data by neighborhood
-    neighborhood_summary = listings.groupby('neighbourhood').agg({
-        'price': 'mean',
-        'number_of_reviews': 'sum',
-        'availability_365': 'count'
-    }).rename(columns={
-        'price': 'Average Price',
-        'number_of_reviews': 'Total Reviews',
-        'availability_365': 'Available Listings Count'
-    }).reset_index()
+    neighborhood_summary = compute_neighborhood_summary()
 
     # [VIZ2] Display chart for Average Price by Neighborhood
+    # st.bar_chart renders in the browser, so no server-side figure/PNG work per rerun
     st.subheader("Average Price by Neighborhood")
-    plt.figure(figsize=(10, 6))
-    sns.barplot(data=neighborhood_summary, x='neighbourhood', y='Average Price', palette='Blues_d')
-    plt.xticks(rotation=45, ha='right')
-    plt.title("Average Price by Neighborhood")
-    plt.xlabel("Neighborhood")
-    plt.ylabel("Average Price ($)")
-    st.pyplot(plt)
+    st.bar_chart(neighborhood_summary.set_index('neighbourhood')[['Average Price']])
 
     # [VIZ3] Display chart for Total Reviews by Neighborhood
     st.subheader("Total Reviews by Neighborhood")
-    plt.figure(figsize=(10, 6))
-    sns.barplot(data=neighborhood_summary, x='neighbourhood', y='Total Reviews', palette='Greens_d')
-    plt.xticks(rotation=45, ha='right')
-    plt.title("Total Reviews by Neighborhood")
-    plt.xlabel("Neighborhood")
-    plt.ylabel("Total Reviews")
-    st.pyplot(plt)
+    st.bar_chart(neighborhood_summary.set_index('neighbourhood')[['Total Reviews']])
 
     # [VIZ4] Display chart for Available Listings by Neighborhood
     st.subheader("Available Listings by Neighborhood")
-    plt.figure(figsize=(10, 6))
-    sns.barplot(data=neighborhood_summary, x='neighbourhood', y='Available Listings Count', palette='Oranges_d')
-    plt.xticks(rotation=45, ha='right')
-    plt.title("Available Listings by Neighborhood")
-    plt.xlabel("Neighborhood")
-    plt.ylabel("Available Listings")
-    st.pyplot(plt)
+    st.bar_chart(neighborhood_summary.set_index('neighbourhood')[['Available Listings Count']])
    
-    # [PY4] Create a list of dictionaries for neighborhood data
-    neighborhood_dict_list = [
-        {
-            'Neighborhood': row['neighbourhood'],
-            'Average Price': round(row['Average Price'], 2),
-            'Total Reviews': row['Total Reviews'],
-            'Available Listings Count': row['Available Listings Count']
-        }
-        for _, row in neighborhood_summary.iterrows()
-    ]
-
-    neighborhood_df = pd.DataFrame(neighborhood_dict_list)
-
-    # Display it as a styled data frame
+    # Display the summary as a styled data frame (the formatter already handles
+    # rounding, so no intermediate dict list or rebuilt DataFrame is needed)
     st.subheader("Neighborhood Data Summary")
-    st.dataframe(neighborhood_df.style.format({
-    "Average Price": "${:.2f}", 
-    "Total Reviews": "{:,}", 
+    st.dataframe(neighborhood_summary.rename(columns={'neighbourhood': 'Neighborhood'}).style.format({
+    "Average Price": "${:.2f}",
+    "Total Reviews": "{:,}",
     "Available Listings Count": "{:,}"
     }))
 
@@ -146,41 +236,17 @@ elif section == "Listing Map and Price Distribution By Neighborhood":
     st.title("Listing Map and Price Distribution By Neighborhood")
 
     # [ST2] Sidebar filters for map visualization
-    neighborhood = st.sidebar.selectbox("Select a Neighborhood", listings['neighbourhood'].unique())
-    price_range = st.sidebar.slider("Select Price Range", int(listings['price'].min()), int(listings['price'].max()),
-                                    (50, 300))
+    min_price, max_price = price_bounds()
+    neighborhood = st.sidebar.selectbox("Select a Neighborhood", neighborhood_options())
+    price_range = st.sidebar.slider("Select Price Range", min_price, max_price, (50, 300))
     filtered_listings = filter_listings(neighborhood, price_range)
 
     # [MAP] Interactive map visualization using pydeck
     st.subheader("Map of Filtered Listings")
-    map_layer = pdk.Layer(
-        'ScatterplotLayer',
-        data=filtered_listings,
-        get_position='[longitude, latitude]',
-        get_radius=150,
-        get_color='[255, 0, 0, 160]',
-        pickable=True
-    )
-    view_state = pdk.ViewState(
-        latitude=filtered_listings['latitude'].mean(),
-        longitude=filtered_listings['longitude'].mean(),
-        zoom=13,
-        pitch=45
-    )
-    map = pdk.Deck(
-        layers=[map_layer],
-        initial_view_state=view_state,
-        tooltip={"text": "{name}: ${price_per_night}"}
-    )
-    st.pydeck_chart(map)
+    st.pydeck_chart(build_deck(neighborhood, price_range[0], price_range[1]))
 
     # [VIZ5] Price distribution bar chart
+    # nlargest is a partial sort, O(N log 20) instead of sorting everything
     st.subheader("Price Distribution in Selected Neighborhood")
-    sorted_listings = filtered_listings.sort_values(by='price', ascending=False)
-    plt.figure(figsize=(14, 6))
-    sns.barplot(data=sorted_listings.head(20), x='name', y='price', palette='viridis')
-    plt.xticks(rotation=45, ha='right')
-    plt.title('Top 20 Listings by Price')
-    plt.xlabel('Listing Name')
-    plt.ylabel('Price ($)')
-    st.pyplot(plt)
+    top_listings = filtered_listings.nlargest(20, 'price')
+    st.bar_chart(top_listings.set_index('name')['price'])